@@ -1,8 +1,23 @@
-import re
+import functools
+import math
 import subprocess
 from pathlib import Path
 
 from ttscli.models import Segment
+from ttscli.providers.base import CACHE_DIR
+
+# Imported once at module load instead of inside each helper; pydub's first
+# import probes for ffmpeg, so paying that cost here keeps it off the first
+# segment's latency.
+try:
+    from pydub import AudioSegment
+except ImportError:
+    AudioSegment = None
+
+try:
+    from mutagen.mp3 import MP3
+except ImportError:
+    MP3 = None
 
 # Approximate speech rate in chars/second per language
 CHARS_PER_SEC: dict[str, float] = {
@@ -21,7 +36,27 @@ MAX_CHUNK_SIZES: dict[str, int] = {
     "minimax": 10000,
 }
 
-_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?。！？])\s+')
+_SENTENCE_PUNCT = frozenset(".!?。！？")
+
+
+def _split_sentences(text: str) -> list[str]:
+    """Split on whitespace runs following sentence punctuation, in one pass."""
+    sentences: list[str] = []
+    start = 0
+    i = 0
+    n = len(text)
+    while i < n:
+        if text[i] in _SENTENCE_PUNCT and i + 1 < n and text[i + 1].isspace():
+            sentences.append(text[start : i + 1])
+            i += 1
+            while i < n and text[i].isspace():
+                i += 1
+            start = i
+        else:
+            i += 1
+    if start < n:
+        sentences.append(text[start:])
+    return sentences
 
 
 def estimate_chars_per_sec(language: str) -> float:
@@ -35,65 +70,128 @@ def calculate_speed(
     chars_per_sec: float,
     speed_min: float,
     speed_max: float,
-) -> tuple[float, bool]:
-    """Return (clamped_speed, is_within_range)."""
+) -> tuple[float, float, bool]:
+    """Return (clamped_speed, required_speed, is_within_range)."""
     if target_duration <= 0:
-        return 1.0, True
+        return 1.0, 1.0, True
     estimated_duration = len(text) / chars_per_sec
     required_speed = estimated_duration / target_duration
     clamped = max(speed_min, min(speed_max, required_speed))
-    return clamped, (speed_min <= required_speed <= speed_max)
+    return clamped, required_speed, (speed_min <= required_speed <= speed_max)
 
 
 def chunk_text(text: str, max_chars: int) -> list[str]:
     if len(text) <= max_chars:
         return [text]
 
-    sentences = _SENTENCE_SPLIT_RE.split(text)
+    sentences = _split_sentences(text)
     chunks: list[str] = []
-    current = ""
+    # Accumulate sentence parts and join once per chunk — repeated string
+    # concatenation would be quadratic in the chunk size.
+    current_parts: list[str] = []
+    current_len = 0
 
     for sentence in sentences:
-        if len(current) + (1 if current else 0) + len(sentence) <= max_chars:
-            current = (current + " " + sentence).lstrip() if current else sentence
+        if current_len + (1 if current_parts else 0) + len(sentence) <= max_chars:
+            current_len += (1 if current_parts else 0) + len(sentence)
+            current_parts.append(sentence)
         else:
-            if current:
-                chunks.append(current)
+            if current_parts:
+                chunks.append(" ".join(current_parts))
             if len(sentence) <= max_chars:
-                current = sentence
+                current_parts = [sentence]
+                current_len = len(sentence)
             else:
                 # Hard split at max_chars
                 while len(sentence) > max_chars:
                     chunks.append(sentence[:max_chars])
                     sentence = sentence[max_chars:]
-                current = sentence
+                sentence = sentence.lstrip()
+                current_parts = [sentence] if sentence else []
+                current_len = len(sentence)
 
-    if current:
-        chunks.append(current)
+    if current_parts:
+        chunks.append(" ".join(current_parts))
 
     return chunks
 
 
-def concat_audio(audio_paths: list[Path], output_path: Path) -> None:
-    from pydub import AudioSegment
+def _probe_audio_params(path: Path) -> tuple[int, int]:
+    """Return (sample_rate, channels) of the first audio stream, defaulting to (44100, 1)."""
+    try:
+        result = subprocess.run(
+            ["ffprobe", "-v", "error", "-select_streams", "a:0",
+             "-show_entries", "stream=sample_rate,channels",
+             "-of", "default=nw=1:nk=1", str(path)],
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+        sample_rate, channels = result.stdout.split()
+        return int(sample_rate), int(channels)
+    except Exception:
+        return 44100, 1
+
+
+def _ffmpeg_concat(audio_paths: list[Path], output_path: Path) -> bool:
+    """Concatenate audio files with the ffmpeg concat demuxer (stream copy, no re-encode)."""
+    if not audio_paths:
+        return False
+    list_file = output_path.with_suffix(".concat.txt")
+    try:
+        list_file.write_text(
+            "".join(f"file '{p.resolve()}'\n" for p in audio_paths),
+            encoding="utf-8",
+        )
+        result = subprocess.run(
+            ["ffmpeg", "-y", "-f", "concat", "-safe", "0",
+             "-i", str(list_file), "-c", "copy", str(output_path)],
+            capture_output=True,
+            timeout=300,
+        )
+        return result.returncode == 0 and output_path.exists()
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return False
+    finally:
+        list_file.unlink(missing_ok=True)
 
+
+def concat_audio(audio_paths: list[Path], output_path: Path) -> None:
+    if _ffmpeg_concat(audio_paths, output_path):
+        return
+    # Fallback: decode and re-encode via pydub (e.g. mismatched codec params)
+    if AudioSegment is None:
+        raise RuntimeError("pydub is required for audio concat fallback")
     combined = AudioSegment.empty()
     for path in audio_paths:
-        if path.exists():
-            combined += AudioSegment.from_file(str(path))
+        combined += AudioSegment.from_file(str(path))
     combined.export(str(output_path), format="mp3")
 
 
 def get_audio_duration(path: Path) -> float:
+    if MP3 is not None:
+        try:
+            return MP3(str(path)).info.length
+        except Exception:
+            pass
+    # ffprobe reads the container header instead of decoding the whole file
     try:
-        from mutagen.mp3 import MP3
-        return MP3(str(path)).info.length
-    except Exception:
+        result = subprocess.run(
+            ["ffprobe", "-v", "error", "-show_entries", "format=duration",
+             "-of", "default=nw=1:nk=1", str(path)],
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+        return float(result.stdout.strip() or 0.0)
+    except FileNotFoundError:
+        # ffprobe missing: last resort, decode via pydub
         try:
-            from pydub import AudioSegment
             return len(AudioSegment.from_file(str(path))) / 1000.0
         except Exception:
             return 0.0
+    except Exception:
+        return 0.0
 
 
 def apply_time_stretch(input_path: Path, target_duration: float, output_path: Path) -> bool:
@@ -103,7 +201,8 @@ def apply_time_stretch(input_path: Path, target_duration: float, output_path: Pa
         return False
 
     ratio = current / target_duration
-    filter_chain = _build_atempo_filter(ratio)
+    # Rounding keys the lru_cache: ratios in a long transcript cluster near 1.0
+    filter_chain = _build_atempo_filter(round(ratio, 4))
 
     try:
         result = subprocess.run(
@@ -116,25 +215,64 @@ def apply_time_stretch(input_path: Path, target_duration: float, output_path: Pa
         return False
 
 
+@functools.lru_cache(maxsize=128)
 def _build_atempo_filter(ratio: float) -> str:
+    # atempo only accepts 0.5–2.0, so out-of-range ratios are chained.
+    # The number of 2.0/0.5 stages follows in closed form from log2(ratio).
     if 0.5 <= ratio <= 2.0:
         return f"atempo={ratio:.4f}"
     elif ratio > 2.0:
-        filters: list[str] = []
-        r = ratio
-        while r > 2.0:
-            filters.append("atempo=2.0")
-            r /= 2.0
-        filters.append(f"atempo={r:.4f}")
-        return ",".join(filters)
+        stages = math.ceil(math.log2(ratio)) - 1
+        residual = ratio / (2.0 ** stages)
+        return "atempo=2.0," * stages + f"atempo={residual:.4f}"
     else:
-        filters = []
-        r = ratio
-        while r < 0.5:
-            filters.append("atempo=0.5")
-            r *= 2.0
-        filters.append(f"atempo={r:.4f}")
-        return ",".join(filters)
+        stages = math.ceil(-math.log2(ratio)) - 1
+        residual = ratio * (2.0 ** stages)
+        return "atempo=0.5," * stages + f"atempo={residual:.4f}"
+
+
+def assemble_timed_ffmpeg(
+    entries: list[tuple[Path, int, float | None]],
+    total_duration: float,
+    output_path: Path,
+) -> bool:
+    """Stretch and place all segments in one ffmpeg filtergraph invocation.
+
+    *entries* is a list of (path, delay_ms, stretch_ratio) where stretch_ratio
+    is None when the segment needs no atempo. Replaces N per-segment ffmpeg
+    stretch spawns plus a separate mixing pass with a single process.
+    """
+    if not entries or total_duration <= 0:
+        return False
+
+    cmd = ["ffmpeg", "-y"]
+    filter_parts: list[str] = []
+    for idx, (path, delay_ms, ratio) in enumerate(entries):
+        cmd += ["-i", str(path)]
+        filters: list[str] = []
+        # The rounded ratio must stay positive, mirroring apply_time_stretch's
+        # guard: a degenerate duration probe can yield 0.0 (or round to it),
+        # which atempo (and log2) cannot take.
+        if ratio is not None:
+            ratio = round(ratio, 4)
+            if ratio > 0 and abs(ratio - 1.0) > 1e-4:
+                filters.append(_build_atempo_filter(ratio))
+        filters.append(f"adelay={delay_ms}:all=1")
+        filter_parts.append(f"[{idx}:a]{','.join(filters)}[a{idx}]")
+
+    n = len(entries)
+    filter_parts.append(
+        "".join(f"[a{i}]" for i in range(n))
+        + f"amix=inputs={n}:duration=longest:normalize=0,"
+        + f"apad=whole_dur={total_duration:.3f},atrim=0:{total_duration:.3f}[out]"
+    )
+    cmd += ["-filter_complex", ";".join(filter_parts), "-map", "[out]", str(output_path)]
+
+    try:
+        result = subprocess.run(cmd, capture_output=True, timeout=600)
+        return result.returncode == 0 and output_path.exists()
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return False
 
 
 def assemble_timed(
@@ -144,35 +282,116 @@ def assemble_timed(
     output_path: Path,
     fmt: str,
 ) -> None:
-    from pydub import AudioSegment
-
-    output = AudioSegment.silent(duration=int(total_duration * 1000))
+    import numpy as np
+
+    if AudioSegment is None:
+        raise RuntimeError("pydub is required for timed assembly")
+
+    # Mix into one preallocated int32 buffer instead of chaining
+    # AudioSegment.overlay, which copies the whole output per segment.
+    sample_rate = 44100
+    channels = 1
+    # The convert loop only hands over paths it successfully produced, so no
+    # exists() pre-check is needed; unreadable files are simply skipped.
+    decoded: list[tuple[Segment, "AudioSegment"]] = []
     for segment, audio_path in zip(segments, audio_files):
-        if not audio_path.exists():
-            continue
         try:
             audio = AudioSegment.from_file(str(audio_path))
-            position_ms = int(segment.start * 1000)
-            output = output.overlay(audio, position=position_ms)
         except Exception:
-            pass
+            continue
+        if not decoded:
+            sample_rate = audio.frame_rate
+            channels = audio.channels
+        decoded.append((segment, audio))
+
+    n_frames = int(total_duration * sample_rate)
+    mix = np.zeros((n_frames, channels), dtype=np.int32)
+
+    for segment, audio in decoded:
+        audio = audio.set_frame_rate(sample_rate).set_channels(channels).set_sample_width(2)
+        samples = np.frombuffer(audio.raw_data, dtype=np.int16).reshape(-1, channels)
+        start = int(segment.start * sample_rate)
+        if start >= n_frames:
+            continue
+        end = min(start + len(samples), n_frames)
+        mix[start:end] += samples[: end - start]
+
+    np.clip(mix, -32768, 32767, out=mix)
+    output = AudioSegment(
+        mix.astype(np.int16).tobytes(),
+        frame_rate=sample_rate,
+        sample_width=2,
+        channels=channels,
+    )
     output.export(str(output_path), format=fmt)
 
 
+def _make_gap_file(gap_ms: int, sample_rate: int, channels: int, gap_path: Path) -> bool:
+    """Generate a silence MP3 matching the segment codec params for stream-copy concat."""
+    layout = "stereo" if channels == 2 else "mono"
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-y", "-f", "lavfi",
+             "-i", f"anullsrc=r={sample_rate}:cl={layout}",
+             "-t", f"{gap_ms / 1000:.3f}", "-acodec", "libmp3lame", str(gap_path)],
+            capture_output=True,
+            timeout=30,
+        )
+        return result.returncode == 0 and gap_path.exists()
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return False
+
+
+# Silence files keyed by (gap_ms, sample_rate, channels) — synthesized at most
+# once per parameter combination and reused across assemble_natural calls.
+_SILENCE_CACHE: dict[tuple[int, int, int], Path] = {}
+
+
+def _silence_file(gap_ms: int, sample_rate: int, channels: int) -> Path | None:
+    key = (gap_ms, sample_rate, channels)
+    cached = _SILENCE_CACHE.get(key)
+    if cached is not None and cached.exists():
+        return cached
+    # Under the per-user cache dir, not the shared system tmpdir: a world-
+    # writable location would let another user pre-plant audio at the
+    # predictable path and have it spliced into the output.
+    gap_dir = CACHE_DIR / "silence"
+    gap_path = gap_dir / f"gap_{gap_ms}_{sample_rate}_{channels}.mp3"
+    try:
+        gap_dir.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return None
+    if gap_path.exists() or _make_gap_file(gap_ms, sample_rate, channels, gap_path):
+        _SILENCE_CACHE[key] = gap_path
+        return gap_path
+    return None
+
+
 def assemble_natural(
     audio_files: list[Path],
     output_path: Path,
     fmt: str,
     gap_ms: int = 300,
 ) -> float:
-    from pydub import AudioSegment
-
+    if fmt == "mp3" and audio_files:
+        sample_rate, channels = _probe_audio_params(audio_files[0])
+        gap_path = _silence_file(gap_ms, sample_rate, channels)
+        if gap_path is not None:
+            interleaved: list[Path] = []
+            for i, audio_path in enumerate(audio_files):
+                if i > 0:
+                    interleaved.append(gap_path)
+                interleaved.append(audio_path)
+            if _ffmpeg_concat(interleaved, output_path):
+                return get_audio_duration(output_path)
+
+    # Fallback: decode and re-encode via pydub
+    if AudioSegment is None:
+        raise RuntimeError("pydub is required for natural assembly fallback")
     output: AudioSegment = AudioSegment.empty()
     gap = AudioSegment.silent(duration=gap_ms)
 
     for i, audio_path in enumerate(audio_files):
-        if not audio_path.exists():
-            continue
         try:
             audio = AudioSegment.from_file(str(audio_path))
             if i > 0:
@@ -1,6 +1,7 @@
-import shutil
 import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import Mapping
 
 import click
 from rich.console import Console
@@ -11,6 +12,7 @@ from ttscli.audio import (
     apply_time_stretch,
     assemble_natural,
     assemble_timed,
+    assemble_timed_ffmpeg,
     calculate_speed,
     chunk_text,
     concat_audio,
@@ -41,17 +43,28 @@ _GENDER_VOICES: dict[str, dict[str, str]] = {
     },
 }
 
+# Flat (provider, gender) → voice lookup, built once at import
+_GENDER_VOICE_TABLE: dict[tuple[str, str], str] = {
+    (p, g): v for p, genders in _GENDER_VOICES.items() for g, v in genders.items()
+}
+
+
+def _gender_voice_overrides(provider_cfg: Mapping) -> dict[str, str]:
+    """Extract `male_voice` / `female_voice` config overrides as a gender → voice map."""
+    return {
+        gender: provider_cfg[key]
+        for gender, key in (("male", "male_voice"), ("female", "female_voice"))
+        if key in provider_cfg
+    }
+
 
 def _resolve_gender_voice(
-    provider_name: str, gender: str | None, provider_cfg: dict
+    provider_name: str, gender: str | None, overrides: dict[str, str]
 ) -> str | None:
     """Return a voice ID/name matching *gender*, respecting config overrides."""
     if not gender:
         return None
-    config_key = f"{gender}_voice"
-    if config_key in provider_cfg:
-        return provider_cfg[config_key]
-    return _GENDER_VOICES.get(provider_name, {}).get(gender)
+    return overrides.get(gender) or _GENDER_VOICE_TABLE.get((provider_name, gender))
 
 
 def _fmt_time(seconds: float) -> str:
@@ -152,6 +165,7 @@ def convert(
     # Load config defaults
     cfg = load_config(config_file)
     provider_cfg = cfg.get(provider_name, {})
+    gender_overrides = _gender_voice_overrides(provider_cfg)
 
     # Effective default voice: --voice-id > --voice > config default
     effective_voice: str | None = voice_id or voice
@@ -199,7 +213,7 @@ def convert(
         f"[dim]({len(segs_to_process)} segments, {provider_name}, {mode} mode)[/dim]"
     )
 
-    audio_pairs: list[tuple] = []  # (segment, Path)
+    audio_pairs: list[tuple] = []  # (segment, Path, stretch_ratio | None)
 
     with tempfile.TemporaryDirectory() as _tmpdir:
         tmpdir = Path(_tmpdir)
@@ -209,6 +223,20 @@ def convert(
                 f"Converting...", total=len(segs_to_process)
             )
 
+            # Fallback voice from the provider's listing: fetched lazily and at
+            # most once, since list_voices can be a network call.
+            fallback_voice: str | None = None
+
+            def _provider_fallback_voice() -> str:
+                nonlocal fallback_voice
+                if fallback_voice is None:
+                    available = provider.list_voices()
+                    fallback_voice = available[0] if available else "default"
+                return fallback_voice
+
+            # Prepare tasks up front: resolve voice/speed/chunks sequentially,
+            # then dispatch synthesis (network-bound) to a thread pool.
+            tasks: list[tuple[int, object, str, float, list[str]]] = []
             for i, segment in enumerate(segs_to_process):
                 # Resolve voice for this segment:
                 # 1. explicit speaker→voice map (CLI or config)
@@ -218,20 +246,18 @@ def convert(
                 seg_voice = (
                     full_speaker_map.get(segment.speaker or "")
                     or effective_voice
-                    or _resolve_gender_voice(provider_name, segment.gender, provider_cfg)
+                    or _resolve_gender_voice(provider_name, segment.gender, gender_overrides)
                 )
                 if not seg_voice:
-                    available = provider.list_voices()
-                    seg_voice = available[0] if available else "default"
+                    seg_voice = _provider_fallback_voice()
 
                 # Calculate speed for timed mode
                 speed = 1.0
                 if mode == "timed" and segment.duration > 0:
-                    speed, in_range = calculate_speed(
+                    speed, req, in_range = calculate_speed(
                         segment.text, segment.duration, chars_per_sec, speed_min, speed_max
                     )
                     if not in_range:
-                        req = len(segment.text) / chars_per_sec / segment.duration
                         if req > speed_max:
                             progress.console.print(
                                 f"[yellow]⚠  [{_fmt_time(segment.start)}] text too long "
@@ -243,6 +269,13 @@ def convert(
                                 f"({req:.2f}× < {speed_min}×), clamping to {speed_min}×[/yellow]"
                             )
 
+                # Split text if it exceeds API limit
+                chunks = chunk_text(segment.text, max_chars)
+                tasks.append((i, segment, seg_voice, speed, chunks))
+
+            def _synthesize_one(
+                i: int, segment, seg_voice: str, speed: float, chunks: list[str]
+            ) -> tuple[Path, float | None] | None:
                 seg_path = tmpdir / f"seg_{i:04d}.mp3"
 
                 seg_step = StepProgress(
@@ -252,9 +285,6 @@ def convert(
                     total=100,
                 )
 
-                # Split text if it exceeds API limit
-                chunks = chunk_text(segment.text, max_chars)
-
                 try:
                     if len(chunks) == 1:
                         actual_duration = provider.synthesize(
@@ -262,48 +292,79 @@ def convert(
                         )
                     else:
                         chunk_paths: list[Path] = []
+                        actual_duration = 0.0
                         for j, chunk in enumerate(chunks):
                             chunk_path = tmpdir / f"seg_{i:04d}_c{j:02d}.mp3"
-                            provider.synthesize(chunk, seg_voice, speed, chunk_path, seg_step)
+                            actual_duration += provider.synthesize(
+                                chunk, seg_voice, speed, chunk_path, seg_step
+                            )
                             chunk_paths.append(chunk_path)
+                        # Stream-copy concat preserves total duration, so the
+                        # summed per-chunk durations stand in for re-measuring.
                         concat_audio(chunk_paths, seg_path)
-                        actual_duration = get_audio_duration(seg_path)
                 except Exception as e:
                     seg_step.finish()
                     progress.console.print(
                         f"[yellow]⚠  [{_fmt_time(segment.start)}] skipped: {e}[/yellow]"
                     )
-                    progress.advance(main_task, 1)
-                    continue
-
-                # Timed mode: time-stretch if provider doesn't support speed param
-                final_path = seg_path
-                if mode == "timed" and seg_path.exists() and segment.duration > 0:
+                    return None
+
+                # Timed mode: record the stretch ratio instead of spawning a
+                # per-segment ffmpeg — the stretch happens inside the fused
+                # assembly filtergraph.
+                stretch_ratio: float | None = None
+                # actual_duration can probe to 0.0 for degenerate audio (e.g.
+                # an empty stream); a zero ratio would be an invalid atempo.
+                if mode == "timed" and segment.duration > 0 and actual_duration > 0:
                     tolerance = 0.5
                     if not provider.supports_speed_param and abs(actual_duration - segment.duration) > tolerance:
-                        stretched = tmpdir / f"seg_{i:04d}_stretched.mp3"
-                        if apply_time_stretch(seg_path, segment.duration, stretched):
-                            final_path = stretched
-
-                # Copy to a stable path so tmpdir cleanup doesn't matter during assembly
-                stable_path = tmpdir / f"final_{i:04d}.mp3"
-                if final_path.exists():
-                    shutil.copy2(final_path, stable_path)
-                    audio_pairs.append((segment, stable_path))
-                else:
-                    progress.console.print(
-                        f"[red]✗ [{_fmt_time(segment.start)}] failed, skipping[/red]"
-                    )
+                        stretch_ratio = actual_duration / segment.duration
+
+                # The tmpdir outlives assembly, so the synthesized file can be
+                # used in place — no copy to a separate "stable" path needed.
+                if seg_path.exists():
+                    return seg_path, stretch_ratio
+                progress.console.print(
+                    f"[red]✗ [{_fmt_time(segment.start)}] failed, skipping[/red]"
+                )
+                return None
+
+            # Synthesis is I/O-bound (network calls), so threads overlap the
+            # provider round-trips; results are re-ordered by segment index.
+            results: list[tuple[Path, float | None] | None] = [None] * len(tasks)
+            workers = min(8, len(tasks))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                future_to_index = {
+                    executor.submit(_synthesize_one, *task): task[0] for task in tasks
+                }
+                for future in as_completed(future_to_index):
+                    results[future_to_index[future]] = future.result()
+                    progress.advance(main_task, 1)
 
-                progress.advance(main_task, 1)
+            for (i, segment, _, _, _), result in zip(tasks, results):
+                if result is not None:
+                    audio_pairs.append((segment, result[0], result[1]))
 
             # Assembly
             asm_step = StepProgress(progress, "Assembling final audio...", total=100)
-            segs_only = [s for s, _ in audio_pairs]
-            paths_only = [p for _, p in audio_pairs]
+            segs_only = [s for s, _, _ in audio_pairs]
+            paths_only = [p for _, p, _ in audio_pairs]
 
             if mode == "timed":
-                assemble_timed(segs_only, paths_only, total_duration, output, fmt)
+                entries = [
+                    (path, int(segment.start * 1000), ratio)
+                    for segment, path, ratio in audio_pairs
+                ]
+                if not assemble_timed_ffmpeg(entries, total_duration, output):
+                    # Fallback: per-segment atempo passes, then the NumPy mixer
+                    final_paths: list[Path] = []
+                    for i, (segment, path, ratio) in enumerate(audio_pairs):
+                        if ratio is not None:
+                            stretched = tmpdir / f"seg_{i:04d}_stretched.mp3"
+                            if apply_time_stretch(path, segment.duration, stretched):
+                                path = stretched
+                        final_paths.append(path)
+                    assemble_timed(segs_only, final_paths, total_duration, output, fmt)
             else:
                 assemble_natural(paths_only, output, fmt)
 
@@ -1,5 +1,8 @@
+import functools
 import os
 from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping
 
 try:
     import tomllib
@@ -21,12 +24,19 @@ ENV_EXTRA: dict[str, dict[str, str]] = {
 }
 
 
-def load_config(config_path: Path | None = None) -> dict:
-    path = config_path or DEFAULT_CONFIG_PATH
+@functools.lru_cache(maxsize=4)
+def _load_config_cached(path_str: str) -> Mapping:
+    path = Path(path_str)
     if not path.exists():
-        return {}
+        return MappingProxyType({})
     with open(path, "rb") as f:
-        return tomllib.load(f)
+        return MappingProxyType(tomllib.load(f))
+
+
+def load_config(config_path: Path | None = None) -> Mapping:
+    """Load the TOML config, cached per resolved path for the process lifetime."""
+    path = config_path or DEFAULT_CONFIG_PATH
+    return _load_config_cached(str(path.expanduser().resolve()))
 
 
 def resolve_api_key(
@@ -8,13 +8,34 @@ SEGMENT_RE = re.compile(
     r'(?:\s+\*\*(\w+)\*\*)?\s+(.*)'
 )
 
-# Matches sttcli gender rows:
+# Matches any header-table row, extracting (key, value) in one shot:
+#   | Provider | openai |
 #   | Gender   | male |          → global gender (no diarization)
 #   | speaker_0_gender | female | → per-speaker gender
-_GENDER_RE = re.compile(r'^\|\s*([\w]+_gender|Gender)\s*\|\s*(\w+)\s*\|')
+_ROW_RE = re.compile(r'\|\s*(\w[\w ]*?)\s*\|\s*([^|]+?)\s*\|')
+
+# First characters a line of interest can start with (segments, table rows,
+# the title heading, or leading whitespace before any of those); everything
+# else is skipped without even allocating a stripped copy.
+_CANDIDATE_CHARS = frozenset("*|# \t")
+
+# Header-table keys mapped to TranscriptMeta fields
+_META_KEYS = {
+    "Provider": "provider",
+    "Model": "model",
+    "Language": "language",
+    "Duration": "duration",
+}
 
 
 def _parse_time(ts: str) -> float:
+    # Fast path for the dominant MM:SS form: one find, no strip/split list
+    first = ts.find(":")
+    if first > 0 and ts.find(":", first + 1) < 0:
+        try:
+            return int(ts[:first]) * 60 + float(ts[first + 1:])
+        except ValueError:
+            pass
     parts = ts.strip().split(":")
     if len(parts) == 2:
         return int(parts[0]) * 60 + float(parts[1])
@@ -25,76 +46,62 @@ def _parse_time(ts: str) -> float:
 
 def parse(path: Path | str) -> ParsedTranscript:
     path = Path(path).expanduser()
-    text = path.read_text(encoding="utf-8")
-    lines = text.splitlines()
 
     source_file = ""
-    provider = ""
-    model = ""
-    language = ""
-    duration = 0.0
+    meta_rows: dict[str, str] = {}
     global_gender: str | None = None
     speaker_genders: dict[str, str] = {}
 
-    for line in lines:
-        stripped = line.strip()
-        if stripped.startswith("# Transcript:"):
-            source_file = stripped.split(":", 1)[1].strip()
-        elif stripped.startswith("| Provider"):
-            parts = stripped.split("|")
-            if len(parts) >= 3:
-                provider = parts[2].strip()
-        elif stripped.startswith("| Model"):
-            parts = stripped.split("|")
-            if len(parts) >= 3:
-                model = parts[2].strip()
-        elif stripped.startswith("| Language"):
-            parts = stripped.split("|")
-            if len(parts) >= 3:
-                language = parts[2].strip()
-        elif stripped.startswith("| Duration"):
-            parts = stripped.split("|")
-            if len(parts) >= 3:
-                duration = _parse_time(parts[2].strip())
-        else:
-            m = _GENDER_RE.match(stripped)
-            if m:
-                key, value = m.group(1), m.group(2).lower()
-                if key.lower() == "gender":
-                    global_gender = value
-                elif key.endswith("_gender"):
-                    speaker = key[: -len("_gender")]
-                    speaker_genders[speaker] = value
-
+    # Single streaming pass: at most one line is resident at a time, and the
+    # prefix dispatch keeps the segment regex off lines that cannot match.
     segments: list[Segment] = []
-    for line in lines:
-        m = SEGMENT_RE.match(line.strip())
-        if m:
-            start = _parse_time(m.group(1))
-            end = _parse_time(m.group(2))
-            speaker = m.group(3) or None
-            seg_text = m.group(4).strip()
-            if seg_text:
-                # Resolve gender for this segment
-                if speaker and speaker in speaker_genders:
-                    seg_gender = speaker_genders[speaker]
-                else:
-                    seg_gender = global_gender
-                segments.append(
-                    Segment(
-                        start=start,
-                        end=end,
-                        speaker=speaker,
-                        text=seg_text,
-                        gender=seg_gender,
-                    )
-                )
+    with path.open("r", encoding="utf-8", buffering=1 << 20) as f:
+        for line in f:
+            if line[0] not in _CANDIDATE_CHARS:
+                continue
+            stripped = line.strip()
+            if stripped.startswith("**["):
+                m = SEGMENT_RE.match(stripped)
+                if m:
+                    seg_text = m.group(4).strip()
+                    if seg_text:
+                        segments.append(
+                            Segment(
+                                start=_parse_time(m.group(1)),
+                                end=_parse_time(m.group(2)),
+                                speaker=m.group(3) or None,
+                                text=seg_text,
+                            )
+                        )
+            elif stripped.startswith("|"):
+                m = _ROW_RE.match(stripped)
+                if m:
+                    key, value = m.group(1), m.group(2)
+                    field = _META_KEYS.get(key)
+                    if field:
+                        meta_rows[field] = value
+                    elif key == "Gender":
+                        global_gender = value.lower()
+                    elif key.endswith("_gender"):
+                        speaker = key[: -len("_gender")]
+                        speaker_genders[speaker] = value.lower()
+            elif stripped.startswith("# Transcript:"):
+                source_file = stripped.split(":", 1)[1].strip()
+
+    # Gender metadata lives in the header table, but resolve after the pass
+    # so segment lines appearing before it are still handled.
+    for segment in segments:
+        if segment.speaker and segment.speaker in speaker_genders:
+            segment.gender = speaker_genders[segment.speaker]
+        else:
+            segment.gender = global_gender
 
+    duration_str = meta_rows.get("duration")
     meta = TranscriptMeta(
-        provider=provider,
-        model=model,
-        language=language,
-        duration=duration,
+        provider=meta_rows.get("provider", ""),
+        model=meta_rows.get("model", ""),
+        language=meta_rows.get("language", ""),
+        duration=_parse_time(duration_str) if duration_str else 0.0,
         source_file=source_file,
         gender=global_gender,
         speaker_genders=speaker_genders,
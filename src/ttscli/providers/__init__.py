@@ -1,15 +1,21 @@
+import functools
+import importlib
+
 from ttscli.providers.base import BaseTTSProvider
 
+# Registry of provider name → (module, class); modules are imported lazily so
+# selecting one provider doesn't pull in the SDKs of the others.
+_PROVIDERS: dict[str, tuple[str, str]] = {
+    "gemini": ("ttscli.providers.gemini", "GeminiTTSProvider"),
+    "elevenlabs": ("ttscli.providers.elevenlabs", "ElevenLabsTTSProvider"),
+    "minimax": ("ttscli.providers.minimax", "MiniMaxTTSProvider"),
+}
+
 
+@functools.lru_cache(maxsize=None)
 def get_provider(name: str) -> type[BaseTTSProvider]:
-    if name == "gemini":
-        from ttscli.providers.gemini import GeminiTTSProvider
-        return GeminiTTSProvider
-    elif name == "elevenlabs":
-        from ttscli.providers.elevenlabs import ElevenLabsTTSProvider
-        return ElevenLabsTTSProvider
-    elif name == "minimax":
-        from ttscli.providers.minimax import MiniMaxTTSProvider
-        return MiniMaxTTSProvider
-    else:
-        raise ValueError(f"Unknown provider: {name}")
+    try:
+        module_name, class_name = _PROVIDERS[name]
+    except KeyError:
+        raise ValueError(f"Unknown provider: {name}") from None
+    return getattr(importlib.import_module(module_name), class_name)
@@ -0,0 +1,32 @@
+"""Cheap MP3 duration probes shared across providers.
+
+pydub's ``AudioSegment.from_mp3`` decodes the whole file to PCM just to read
+its length, so it is deliberately not used here — mutagen parses headers only,
+and ffprobe answers the format query without decoding frames.
+"""
+
+import subprocess
+from pathlib import Path
+
+
+def get_mp3_duration(path: Path) -> float:
+    """Return a file's duration in seconds without decoding it, or 0.0."""
+    try:
+        from mutagen.mp3 import MP3
+        return MP3(str(path)).info.length
+    except Exception:
+        pass
+
+    try:
+        result = subprocess.run(
+            ["ffprobe", "-v", "error", "-show_entries", "format=duration",
+             "-of", "default=nw=1:nk=1", str(path)],
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+        if result.returncode == 0:
+            return float(result.stdout.strip())
+    except (OSError, ValueError, subprocess.TimeoutExpired):
+        pass
+    return 0.0
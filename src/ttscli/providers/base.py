@@ -1,15 +1,45 @@
+import asyncio
+import hashlib
+import json
+import os
+import shutil
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from ttscli.progress import StepProgress
 
+# Transient provider errors worth retrying: rate limit and service unavailable
+_RETRY_STATUS_CODES = frozenset({429, 503})
+_MAX_ATTEMPTS = 3
+
+# Synthesized audio is cached here keyed by content, so repeated phrases skip
+# the paid provider round-trip entirely.
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "ttscli"
+
+# Oldest entries are evicted once a provider's cache exceeds this budget
+CACHE_BUDGET_BYTES = 500 * 1024 * 1024
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
 
 class BaseTTSProvider(ABC):
+    __slots__ = ("model", "api_key")
+
     def __init__(self, model: str | None = None, api_key: str | None = None, **kwargs):
         self.model = model or self.default_model
         self.api_key = api_key
-        for k, v in kwargs.items():
-            setattr(self, k, v)
+        # Subclasses pop their own kwargs before calling up; whatever is left
+        # belongs to another provider (e.g. --stability with minimax) and is
+        # ignored — instances are slotted, so stray setattr would fail anyway.
 
     @property
     @abstractmethod
@@ -27,7 +57,6 @@ class BaseTTSProvider(ABC):
     def speed_range(self) -> tuple[float, float]:
         return (0.25, 4.0)
 
-    @abstractmethod
     def synthesize(
         self,
         text: str,
@@ -35,9 +64,206 @@ class BaseTTSProvider(ABC):
         speed: float,
         output_path: Path,
         step: StepProgress,
+        cache: bool = True,
     ) -> float:
-        """Synthesize text to audio. Returns actual audio duration in seconds."""
+        """Synthesize text to audio. Returns actual audio duration in seconds.
+
+        Results are cached on disk keyed by (provider, model, voice, speed,
+        text, provider params); a hit is a hardlink/copy instead of an API call.
+        """
+        if not cache:
+            return self._synthesize_uncached(text, voice, speed, output_path, step)
+
+        suffix = output_path.suffix.lower() or ".mp3"
+        key = self._cache_key(text, voice, speed, suffix)
+        cached = self._cache_lookup(key, suffix, output_path, step)
+        if cached is not None:
+            return cached
+
+        duration = self._synthesize_uncached(text, voice, speed, output_path, step)
+        self._cache_store(key, suffix, output_path, duration)
+        return duration
+
+    def synthesize_batch(
+        self,
+        items: list[tuple[str, str, float, Path, StepProgress]],
+        workers: int = 4,
+        cache: bool = True,
+    ) -> list[float | BaseException]:
+        """Synthesize many items on a bounded thread pool.
+
+        Workers block on network I/O (GIL released), so throughput scales
+        with the worker cap; all threads share this instance's pooled client.
+        Transient provider errors (429/503) are retried with exponential
+        backoff. Results are in item order; a failed item yields its exception.
+        """
+        def _run(item: tuple[str, str, float, Path, StepProgress]) -> float:
+            text, voice, speed, output_path, step = item
+            return self._synthesize_with_retry(text, voice, speed, output_path, step, cache)
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_run, item) for item in items]
+            results: list[float | BaseException] = []
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as exc:
+                    results.append(exc)
+        return results
+
+    def _synthesize_with_retry(
+        self,
+        text: str,
+        voice: str,
+        speed: float,
+        output_path: Path,
+        step: StepProgress,
+        cache: bool = True,
+    ) -> float:
+        delay = 1.0
+        for attempt in range(_MAX_ATTEMPTS):
+            try:
+                return self.synthesize(text, voice, speed, output_path, step, cache=cache)
+            except Exception as exc:
+                # httpx.HTTPStatusError and most SDK errors carry .response
+                status = getattr(getattr(exc, "response", None), "status_code", None)
+                if status not in _RETRY_STATUS_CODES or attempt == _MAX_ATTEMPTS - 1:
+                    raise
+                time.sleep(delay)
+                delay *= 2
+        raise RuntimeError("unreachable")  # pragma: no cover
+
+    async def synthesize_many(
+        self,
+        items: list[tuple[str, str, float, Path, StepProgress]],
+        concurrency: int = 8,
+        cache: bool = True,
+    ) -> list[float | BaseException]:
+        """Synthesize many (text, voice, speed, output_path, step) items concurrently.
+
+        Network latency overlaps up to *concurrency* in-flight requests; each
+        result is a duration, or the exception that item raised.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _run(item: tuple[str, str, float, Path, StepProgress]) -> float:
+            text, voice, speed, output_path, step = item
+            async with semaphore:
+                if not cache:
+                    return await self._synthesize_async(text, voice, speed, output_path, step)
+                suffix = output_path.suffix.lower() or ".mp3"
+                key = self._cache_key(text, voice, speed, suffix)
+                cached = self._cache_lookup(key, suffix, output_path, step)
+                if cached is not None:
+                    return cached
+                duration = await self._synthesize_async(text, voice, speed, output_path, step)
+                self._cache_store(key, suffix, output_path, duration)
+                return duration
+
+        return await asyncio.gather(*(_run(item) for item in items), return_exceptions=True)
+
+    async def _synthesize_async(
+        self,
+        text: str,
+        voice: str,
+        speed: float,
+        output_path: Path,
+        step: StepProgress,
+    ) -> float:
+        """Async synthesis hook; defaults to running the blocking path in a thread.
+
+        Providers with a native async client override this to avoid tying up a
+        thread per in-flight request.
+        """
+        return await asyncio.to_thread(
+            self._synthesize_uncached, text, voice, speed, output_path, step
+        )
+
+    def synthesize_stream(self, text: str, voice: str, speed: float = 1.0) -> Iterator[bytes]:
+        """Yield audio bytes as they arrive, for playback before synthesis ends.
+
+        Chunks are in the provider's native streaming format (MP3 for
+        ElevenLabs/MiniMax, raw PCM for Gemini). Streamed audio bypasses the
+        disk cache. Providers without a streaming endpoint raise.
+        """
+        raise NotImplementedError(f"{self.provider_name} does not support streaming synthesis")
+
+    @abstractmethod
+    def _synthesize_uncached(
+        self,
+        text: str,
+        voice: str,
+        speed: float,
+        output_path: Path,
+        step: StepProgress,
+    ) -> float:
+        """Provider-specific synthesis. Returns actual audio duration in seconds."""
         ...
 
+    def _cache_key(self, text: str, voice: str, speed: float, suffix: str) -> str:
+        # suffix is part of the key: providers may write container-dependent
+        # bytes (e.g. Gemini emits raw WAV for .wav targets), so a .wav and an
+        # .mp3 of the same text must never share an entry.
+        canonical = json.dumps(
+            [self.provider_name, self.model, voice, round(speed, 4), text,
+             suffix, self._cache_key_extras()],
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _cache_key_extras(self) -> dict:
+        """Provider parameters that affect the audio and must key the cache."""
+        return {}
+
+    def _cache_lookup(
+        self, key: str, suffix: str, output_path: Path, step: StepProgress
+    ) -> float | None:
+        audio_path = CACHE_DIR / self.provider_name / f"{key}{suffix}"
+        meta_path = audio_path.with_suffix(".json")
+        if audio_path.exists() and meta_path.exists():
+            try:
+                duration = json.loads(meta_path.read_text())["duration"]
+                _link_or_copy(audio_path, output_path)
+                os.utime(audio_path)  # mark as recently used for eviction
+                step.finish()
+                return duration
+            except (OSError, ValueError, KeyError):
+                pass
+        return None
+
+    def _cache_store(self, key: str, suffix: str, output_path: Path, duration: float) -> None:
+        if not output_path.exists():
+            return
+        cache_dir = CACHE_DIR / self.provider_name
+        audio_path = cache_dir / f"{key}{suffix}"
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            _link_or_copy(output_path, audio_path)
+            audio_path.with_suffix(".json").write_text(json.dumps({"duration": duration}))
+            self._evict_cache(cache_dir)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _evict_cache(cache_dir: Path, budget: int = CACHE_BUDGET_BYTES) -> None:
+        try:
+            entries = [(p, p.stat()) for p in cache_dir.iterdir() if p.suffix != ".json"]
+        except OSError:
+            return
+        total = sum(st.st_size for _, st in entries)
+        if total <= budget:
+            return
+        entries.sort(key=lambda e: e[1].st_mtime)  # least recently used first
+        for path, st in entries:
+            if total <= budget:
+                break
+            path.unlink(missing_ok=True)
+            path.with_suffix(".json").unlink(missing_ok=True)
+            total -= st.st_size
+
     def list_voices(self) -> list[str]:
         return []
+
+    def close(self) -> None:
+        """Release any pooled network clients. Default: nothing to release."""
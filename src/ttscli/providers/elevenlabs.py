@@ -1,15 +1,45 @@
+import hashlib
+import json
+import threading
+import time
+from collections.abc import Iterator
 from pathlib import Path
 
 from ttscli.progress import StepProgress
-from ttscli.providers.base import BaseTTSProvider
+from ttscli.providers._duration import get_mp3_duration
+from ttscli.providers.base import CACHE_DIR, BaseTTSProvider
 
 DEFAULT_VOICE_ID = "21m00Tcm4TlvDq8ikWAM"  # Rachel
 
+# The account's voice list rarely changes; cache it on disk this long so
+# repeated `ttscli voices` calls skip the HTTPS round-trip.
+_VOICES_TTL_SECONDS = 3600
+
+# The SDK yields many small chunks; stage them and write at this granularity
+_WRITE_FLUSH_BYTES = 256 * 1024
+
+# Lazily bound SDK symbols: first call pays the import, later calls skip the
+# import system and from-import rebinding entirely.
+_sdk = None
+
+
+def _get_sdk():
+    global _sdk
+    if _sdk is None:
+        from elevenlabs import AsyncElevenLabs, ElevenLabs, VoiceSettings
+        _sdk = (ElevenLabs, AsyncElevenLabs, VoiceSettings)
+    return _sdk
+
 
 class ElevenLabsTTSProvider(BaseTTSProvider):
+    __slots__ = ("stability", "similarity_boost", "_client", "_async_client", "_client_lock")
+
     def __init__(self, model: str | None = None, api_key: str | None = None, **kwargs):
         self.stability: float = kwargs.pop("stability", 0.5)
         self.similarity_boost: float = kwargs.pop("similarity_boost", 0.75)
+        self._client = None
+        self._async_client = None
+        self._client_lock = threading.Lock()
         super().__init__(model=model, api_key=api_key, **kwargs)
 
     @property
@@ -24,7 +54,29 @@ class ElevenLabsTTSProvider(BaseTTSProvider):
     def supports_speed_param(self) -> bool:
         return False
 
-    def synthesize(
+    def _cache_key_extras(self) -> dict:
+        return {"stability": self.stability, "similarity_boost": self.similarity_boost}
+
+    def _get_client(self):
+        """One SDK client per provider instance so calls share its connection pool."""
+        if self._client is None:
+            # Locked: batch workers race this on first use, and an unguarded
+            # check would construct and leak extra clients.
+            with self._client_lock:
+                if self._client is None:
+                    ElevenLabs, _, _ = _get_sdk()
+                    self._client = ElevenLabs(api_key=self.api_key)
+        return self._client
+
+    def _get_async_client(self):
+        if self._async_client is None:
+            with self._client_lock:
+                if self._async_client is None:
+                    _, AsyncElevenLabs, _ = _get_sdk()
+                    self._async_client = AsyncElevenLabs(api_key=self.api_key)
+        return self._async_client
+
+    def _synthesize_uncached(
         self,
         text: str,
         voice: str,
@@ -32,9 +84,8 @@ class ElevenLabsTTSProvider(BaseTTSProvider):
         output_path: Path,
         step: StepProgress,
     ) -> float:
-        from elevenlabs import ElevenLabs, VoiceSettings
-
-        client = ElevenLabs(api_key=self.api_key)
+        _, _, VoiceSettings = _get_sdk()
+        client = self._get_client()
 
         step.advance_to(10, f"Synthesizing ({self.provider_name} {voice[:8]}...)...")
         audio_generator = client.text_to_speech.convert(
@@ -49,32 +100,118 @@ class ElevenLabsTTSProvider(BaseTTSProvider):
         )
 
         step.advance_to(60, "Writing audio...")
-        with open(output_path, "wb") as f:
+        total_bytes = 0
+        with open(output_path, "wb", buffering=1 << 20) as f:
+            buf = bytearray()
             for chunk in audio_generator:
-                f.write(chunk)
+                buf += chunk
+                if len(buf) >= _WRITE_FLUSH_BYTES:
+                    total_bytes += len(buf)
+                    f.write(buf)
+                    buf.clear()
+            if buf:
+                total_bytes += len(buf)
+                f.write(buf)
 
-        step.advance_to(95, "Measuring duration...")
-        duration = _get_mp3_duration(output_path)
+        duration = _duration_from_bytes(total_bytes, output_path)
         step.finish()
         return duration
 
-    def list_voices(self) -> list[str]:
-        from elevenlabs import ElevenLabs
-        client = ElevenLabs(api_key=self.api_key)
+    async def _synthesize_async(
+        self,
+        text: str,
+        voice: str,
+        speed: float,
+        output_path: Path,
+        step: StepProgress,
+    ) -> float:
+        _, _, VoiceSettings = _get_sdk()
+        client = self._get_async_client()
+
+        step.advance_to(10, f"Synthesizing ({self.provider_name} {voice[:8]}...)...")
+        audio_generator = client.text_to_speech.convert(
+            voice_id=voice,
+            text=text,
+            model_id=self.model,
+            voice_settings=VoiceSettings(
+                stability=self.stability,
+                similarity_boost=self.similarity_boost,
+            ),
+            output_format="mp3_44100_128",
+        )
+
+        step.advance_to(60, "Writing audio...")
+        total_bytes = 0
+        with open(output_path, "wb", buffering=1 << 20) as f:
+            buf = bytearray()
+            async for chunk in audio_generator:
+                buf += chunk
+                if len(buf) >= _WRITE_FLUSH_BYTES:
+                    total_bytes += len(buf)
+                    f.write(buf)
+                    buf.clear()
+            if buf:
+                total_bytes += len(buf)
+                f.write(buf)
+
+        duration = _duration_from_bytes(total_bytes, output_path)
+        step.finish()
+        return duration
+
+    def synthesize_stream(self, text: str, voice: str, speed: float = 1.0) -> Iterator[bytes]:
+        """Yield MP3 chunks as the SDK delivers them (time-to-first-audio path)."""
+        _, _, VoiceSettings = _get_sdk()
+        client = self._get_client()
+
+        yield from client.text_to_speech.convert(
+            voice_id=voice,
+            text=text,
+            model_id=self.model,
+            voice_settings=VoiceSettings(
+                stability=self.stability,
+                similarity_boost=self.similarity_boost,
+            ),
+            output_format="mp3_44100_128",
+        )
+
+    def _voices_cache_path(self) -> Path:
+        # Keyed by API key so switching accounts within the TTL never serves
+        # another account's (possibly private) voices.
+        digest = hashlib.blake2b((self.api_key or "").encode("utf-8"), digest_size=8).hexdigest()
+        return CACHE_DIR / f"elevenlabs_voices_{digest}.json"
+
+    def list_voices(self, refresh: bool = False) -> list[str]:
+        cache_path = self._voices_cache_path()
+        if not refresh:
+            try:
+                cached = json.loads(cache_path.read_text())
+                if time.time() - cached["fetched_at"] < _VOICES_TTL_SECONDS:
+                    return cached["voices"]
+            except (OSError, ValueError, KeyError):
+                pass
+
+        client = self._get_client()
         try:
             voices_resp = client.voices.get_all()
-            return [f"{v.voice_id}  ({v.name})" for v in (voices_resp.voices or [])]
+            voices = [f"{v.voice_id}  ({v.name})" for v in (voices_resp.voices or [])]
         except Exception:
             return []
 
-
-def _get_mp3_duration(path: Path) -> float:
-    try:
-        from mutagen.mp3 import MP3
-        return MP3(str(path)).info.length
-    except Exception:
         try:
-            from pydub import AudioSegment
-            return len(AudioSegment.from_mp3(str(path))) / 1000.0
-        except Exception:
-            return 0.0
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(
+                json.dumps({"fetched_at": time.time(), "voices": voices})
+            )
+        except OSError:
+            pass
+        return voices
+
+
+def _duration_from_bytes(total_bytes: int, path: Path) -> float:
+    """Derive duration from the CBR byte count (mp3_44100_128 → 128 kbps).
+
+    Falls back to parsing the file if nothing was counted.
+    """
+    if total_bytes > 0:
+        return total_bytes * 8 / 128000.0
+    return get_mp3_duration(path)
@@ -1,13 +1,52 @@
 import io
+import subprocess
+import sys
+import threading
+import wave
+from collections.abc import Iterator
 from pathlib import Path
 
 from ttscli.progress import StepProgress
 from ttscli.providers.base import BaseTTSProvider
 
-GEMINI_VOICES = ["Aoede", "Charon", "Fenrir", "Kore", "Puck"]
+GEMINI_VOICES: tuple[str, ...] = tuple(
+    sys.intern(v) for v in ("Aoede", "Charon", "Fenrir", "Kore", "Puck")
+)
+GEMINI_VOICE_SET: frozenset[str] = frozenset(GEMINI_VOICES)
+
+# Lazily bound SDK modules: first call pays the import, later calls (notably
+# _speech_config on every synthesis) skip the import system entirely.
+_sdk = None
+
+
+def _get_sdk():
+    global _sdk
+    if _sdk is None:
+        from google import genai
+        from google.genai import types
+        _sdk = (genai, types)
+    return _sdk
 
 
 class GeminiTTSProvider(BaseTTSProvider):
+    __slots__ = ("_client", "_client_lock")
+
+    def __init__(self, model: str | None = None, api_key: str | None = None, **kwargs):
+        self._client = None
+        self._client_lock = threading.Lock()
+        super().__init__(model=model, api_key=api_key, **kwargs)
+
+    def _get_client(self):
+        """One genai client per provider instance; it serves sync and async calls."""
+        if self._client is None:
+            # Locked: batch workers race this on first use, and an unguarded
+            # check would construct and leak extra clients.
+            with self._client_lock:
+                if self._client is None:
+                    genai, _ = _get_sdk()
+                    self._client = genai.Client(api_key=self.api_key)
+        return self._client
+
     @property
     def default_model(self) -> str:
         return "gemini-2.5-flash-preview-tts"
@@ -20,7 +59,21 @@ class GeminiTTSProvider(BaseTTSProvider):
     def supports_speed_param(self) -> bool:
         return False
 
-    def synthesize(
+    def _speech_config(self, voice: str):
+        _, types = _get_sdk()
+
+        return types.GenerateContentConfig(
+            response_modalities=["AUDIO"],
+            speech_config=types.SpeechConfig(
+                voice_config=types.VoiceConfig(
+                    prebuilt_voice_config=types.PrebuiltVoiceConfig(
+                        voice_name=voice,
+                    )
+                )
+            ),
+        )
+
+    def _synthesize_uncached(
         self,
         text: str,
         voice: str,
@@ -28,62 +81,130 @@ class GeminiTTSProvider(BaseTTSProvider):
         output_path: Path,
         step: StepProgress,
     ) -> float:
-        from google import genai
-        from google.genai import types
-
-        client = genai.Client(api_key=self.api_key)
+        client = self._get_client()
 
         step.advance_to(10, f"Synthesizing ({self.provider_name} {voice})...")
         response = client.models.generate_content(
             model=self.model,
             contents=text,
-            config=types.GenerateContentConfig(
-                response_modalities=["AUDIO"],
-                speech_config=types.SpeechConfig(
-                    voice_config=types.VoiceConfig(
-                        prebuilt_voice_config=types.PrebuiltVoiceConfig(
-                            voice_name=voice,
-                        )
-                    )
-                ),
-            ),
+            config=self._speech_config(voice),
         )
+        return self._write_response(response, text, output_path, step)
 
+    async def _synthesize_async(
+        self,
+        text: str,
+        voice: str,
+        speed: float,
+        output_path: Path,
+        step: StepProgress,
+    ) -> float:
+        client = self._get_client()
+
+        step.advance_to(10, f"Synthesizing ({self.provider_name} {voice})...")
+        response = await client.aio.models.generate_content(
+            model=self.model,
+            contents=text,
+            config=self._speech_config(voice),
+        )
+        return self._write_response(response, text, output_path, step)
+
+    def _write_response(self, response, text: str, output_path: Path, step: StepProgress) -> float:
         step.advance_to(70, "Extracting audio...")
-        audio_bytes = b""
-        mime_type = "audio/L16;rate=24000"
+        # bytearray gives amortized-O(1) appends; += on bytes would recopy the
+        # whole accumulated buffer for every part.
+        audio_bytes = bytearray()
+        mime_type = None
 
         for candidate in response.candidates:
             if not candidate.content:
                 continue
             for part in candidate.content.parts:
-                if hasattr(part, "inline_data") and part.inline_data:
-                    audio_bytes += part.inline_data.data
-                    if part.inline_data.mime_type:
-                        mime_type = part.inline_data.mime_type
+                inline = getattr(part, "inline_data", None)
+                if inline:
+                    audio_bytes.extend(inline.data)
+                    mime_type = inline.mime_type or mime_type
+        mime_type = mime_type or "audio/L16;rate=24000"
 
         if not audio_bytes:
             raise ValueError(f"Gemini returned no audio for text: {repr(text[:50])}")
 
         sample_rate = _parse_sample_rate(mime_type)
+        # The PCM byte count gives the exact duration: 16-bit mono samples
+        duration = len(audio_bytes) / (2 * sample_rate)
+
+        if output_path.suffix.lower() == ".wav":
+            # The L16 bytes are already PCM frames — a WAV header around them
+            # is all a .wav output needs; no encoder, no subprocess.
+            step.advance_to(85, "Writing audio...")
+            with wave.open(str(output_path), "wb") as w:
+                w.setnchannels(1)
+                w.setsampwidth(2)
+                w.setframerate(sample_rate)
+                w.writeframes(audio_bytes)
+        else:
+            step.advance_to(85, "Converting to MP3...")
+            if not _encode_pcm_to_mp3(audio_bytes, sample_rate, output_path):
+                # Fallback: pydub round-trip (raw → AudioSegment → export)
+                from pydub import AudioSegment
+
+                audio_segment = AudioSegment.from_raw(
+                    io.BytesIO(audio_bytes),
+                    sample_width=2,
+                    frame_rate=sample_rate,
+                    channels=1,
+                )
+                audio_segment.export(str(output_path), format="mp3")
 
-        step.advance_to(85, "Converting to MP3...")
-        from pydub import AudioSegment
-
-        audio_segment = AudioSegment.from_raw(
-            io.BytesIO(audio_bytes),
-            sample_width=2,
-            frame_rate=sample_rate,
-            channels=1,
-        )
-        audio_segment.export(str(output_path), format="mp3")
-
-        duration = len(audio_segment) / 1000.0
         step.finish()
         return duration
 
+    def synthesize_stream(self, text: str, voice: str, speed: float = 1.0) -> Iterator[bytes]:
+        """Yield raw s16le PCM chunks as Gemini streams them.
+
+        Note: unlike the other providers this is not MP3 — callers feed it to a
+        PCM sink (sample rate per part mime type, 24 kHz mono by default).
+        """
+        client = self._get_client()
+
+        stream = client.models.generate_content_stream(
+            model=self.model,
+            contents=text,
+            config=self._speech_config(voice),
+        )
+        for chunk in stream:
+            for candidate in chunk.candidates or []:
+                if not candidate.content:
+                    continue
+                for part in candidate.content.parts:
+                    inline = getattr(part, "inline_data", None)
+                    if inline and inline.data:
+                        yield inline.data
+
+    @classmethod
+    def is_valid_voice(cls, voice: str) -> bool:
+        return voice in GEMINI_VOICE_SET
+
     def list_voices(self) -> list[str]:
-        return GEMINI_VOICES
+        return list(GEMINI_VOICES)
+
+
+def _encode_pcm_to_mp3(pcm: bytes, sample_rate: int, output_path: Path) -> bool:
+    """Encode raw s16le mono PCM to MP3 by piping it straight into ffmpeg.
+
+    Avoids pydub's tempfile round-trip and AudioSegment allocation.
+    """
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-y", "-f", "s16le", "-ar", str(sample_rate), "-ac", "1",
+             "-i", "pipe:0", "-codec:a", "libmp3lame", "-b:a", "128k", str(output_path)],
+            input=pcm,
+            capture_output=True,
+            timeout=120,
+        )
+        return result.returncode == 0 and output_path.exists()
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return False
 
 
 def _parse_sample_rate(mime_type: str) -> int:
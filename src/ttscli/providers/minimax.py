@@ -1,12 +1,42 @@
 import binascii
+import functools
+import json
+import sys
+import threading
+from collections.abc import Iterator
 from pathlib import Path
 
+try:
+    import orjson  # noqa: F401 — C JSON encoder/parser; stdlib fallback below
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+    _loads = json.loads
+
 from ttscli.progress import StepProgress
 from ttscli.providers.base import BaseTTSProvider
 
 MINIMAX_TTS_URL = "https://api.minimax.chat/v1/t2a_v2"
 
-MINIMAX_VOICES = [
+# Bitrate requested in audio_setting; also used to derive duration from size
+_AUDIO_BITRATE = 128000
+
+# Lazily bound httpx module, cached so client creation skips the import system.
+_httpx = None
+
+
+def _get_httpx():
+    global _httpx
+    if _httpx is None:
+        import httpx
+        _httpx = httpx
+    return _httpx
+
+# Interned tuple keeps ordered listing; the frozenset gives O(1) validation
+# with pointer-equality comparisons for interned candidates.
+MINIMAX_VOICES: tuple[str, ...] = tuple(sys.intern(v) for v in (
     "male-qn-qingse",
     "male-qn-jingying",
     "male-qn-badao",
@@ -29,13 +59,44 @@ MINIMAX_VOICES = [
     "female-yujie-jingpin",
     "female-chengshu-jingpin",
     "female-tianmei-jingpin",
-]
+))
+MINIMAX_VOICE_SET: frozenset[str] = frozenset(MINIMAX_VOICES)
 
 
 class MiniMaxTTSProvider(BaseTTSProvider):
+    __slots__ = ("group_id", "_client", "_async_client", "_client_lock", "_headers",
+                 "_url", "_audio_setting", "_synthesize_bound")
+
     def __init__(self, model: str | None = None, api_key: str | None = None, **kwargs):
         self.group_id: str | None = kwargs.pop("group_id", None)
+        self._client = None
+        self._async_client = None
+        self._client_lock = threading.Lock()
         super().__init__(model=model, api_key=api_key, **kwargs)
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
+        # Constant per instance; _request_parts only assembles the per-call bits
+        self._url = f"{MINIMAX_TTS_URL}?GroupId={self.group_id}" if self.group_id else None
+        self._audio_setting = {
+            "sample_rate": 32000,
+            "bitrate": _AUDIO_BITRATE,
+            "format": "mp3",
+            "channel": 1,
+        }
+        # Specialized hot path with instance constants pre-bound; None until a
+        # group_id makes requests possible.
+        self._synthesize_bound = (
+            functools.partial(
+                self._synthesize_impl,
+                url=self._url,
+                headers=self._headers,
+                audio_setting=self._audio_setting,
+            )
+            if self._url is not None
+            else None
+        )
 
     @property
     def default_model(self) -> str:
@@ -53,27 +114,19 @@ class MiniMaxTTSProvider(BaseTTSProvider):
     def speed_range(self) -> tuple[float, float]:
         return (0.5, 2.0)
 
-    def synthesize(
-        self,
-        text: str,
-        voice: str,
-        speed: float,
-        output_path: Path,
-        step: StepProgress,
-    ) -> float:
-        import httpx
-
-        speed = max(0.5, min(2.0, speed))
+    def _request_parts(
+        self, text: str, voice: str, speed: float
+    ) -> tuple[str, dict, float]:
+        lo, hi = self.speed_range
+        speed = lo if speed < lo else hi if speed > hi else speed
 
-        if not self.group_id:
+        if self._url is None:
             raise ValueError("MiniMax group_id is required. Set --minimax-group-id or MINIMAX_GROUP_ID env var.")
 
-        url = f"{MINIMAX_TTS_URL}?GroupId={self.group_id}"
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
-        payload = {
+        return self._url, self._build_payload(text, voice, speed), speed
+
+    def _build_payload(self, text: str, voice: str, speed: float, audio_setting: dict | None = None) -> dict:
+        return {
             "model": self.model,
             "text": text,
             "stream": False,
@@ -83,51 +136,173 @@ class MiniMaxTTSProvider(BaseTTSProvider):
                 "vol": 1.0,
                 "pitch": 0,
             },
-            "audio_setting": {
-                "sample_rate": 32000,
-                "bitrate": 128000,
-                "format": "mp3",
-                "channel": 1,
-            },
+            "audio_setting": audio_setting if audio_setting is not None else self._audio_setting,
         }
 
-        step.advance_to(10, f"Synthesizing ({self.provider_name} {voice}, speed={speed:.2f}×)...")
-        with httpx.Client(timeout=120.0) as client:
-            response = client.post(url, headers=headers, json=payload)
-            response.raise_for_status()
-
+    def _write_response(self, response, output_path: Path, step: StepProgress) -> float:
         step.advance_to(70, "Decoding audio...")
-        data = response.json()
-        audio_raw = data["data"]["audio"]
-        audio_bytes = _decode_audio(audio_raw)
+        # The hex audio string dominates the body; hex-decode it straight from
+        # the raw bytes and only fall back to a full JSON parse if the scan
+        # fails (e.g. base64 payload or unexpected framing).
+        audio_bytes = _extract_audio(response.content)
+        if audio_bytes is None:
+            data = _loads(response.content)
+            audio_bytes = _decode_audio(data["data"]["audio"])
 
         step.advance_to(85, "Writing audio...")
         output_path.write_bytes(audio_bytes)
 
-        step.advance_to(95, "Measuring duration...")
-        duration = _get_mp3_duration(output_path)
+        # We request CBR mp3 at 128 kbps, so the byte count gives the duration
+        # without re-parsing the file.
+        duration = len(audio_bytes) * 8 / _AUDIO_BITRATE
         step.finish()
         return duration
 
+    def _synthesize_uncached(
+        self,
+        text: str,
+        voice: str,
+        speed: float,
+        output_path: Path,
+        step: StepProgress,
+    ) -> float:
+        if self._synthesize_bound is None:
+            raise ValueError("MiniMax group_id is required. Set --minimax-group-id or MINIMAX_GROUP_ID env var.")
+        return self._synthesize_bound(text, voice, speed, output_path, step)
+
+    def _synthesize_impl(
+        self,
+        text: str,
+        voice: str,
+        speed: float,
+        output_path: Path,
+        step: StepProgress,
+        *,
+        url: str,
+        headers: dict,
+        audio_setting: dict,
+    ) -> float:
+        """Hot path with instance constants pre-bound via functools.partial.
+
+        Bound as _synthesize_bound at construction so batch callers skip the
+        per-call attribute lookups for url/headers/audio_setting.
+        """
+        lo, hi = self.speed_range
+        speed = lo if speed < lo else hi if speed > hi else speed
+
+        step.advance_to(10, f"Synthesizing ({self.provider_name} {voice}, speed={speed:.2f}×)...")
+        payload = self._build_payload(text, voice, speed, audio_setting)
+        response = self._get_client().post(url, headers=headers, content=_dumps(payload))
+        response.raise_for_status()
+
+        return self._write_response(response, output_path, step)
+
+    async def _synthesize_async(
+        self,
+        text: str,
+        voice: str,
+        speed: float,
+        output_path: Path,
+        step: StepProgress,
+    ) -> float:
+        url, payload, speed = self._request_parts(text, voice, speed)
+
+        step.advance_to(10, f"Synthesizing ({self.provider_name} {voice}, speed={speed:.2f}×)...")
+        client = self._get_async_client()
+        response = await client.post(url, headers=self._headers, content=_dumps(payload))
+        response.raise_for_status()
+
+        return self._write_response(response, output_path, step)
+
+    def synthesize_stream(self, text: str, voice: str, speed: float = 1.0) -> Iterator[bytes]:
+        """Yield MP3 chunks as they arrive from MiniMax's SSE stream."""
+        url, payload, _ = self._request_parts(text, voice, speed)
+        payload["stream"] = True
+
+        client = self._get_client()
+        with client.stream("POST", url, headers=self._headers, content=_dumps(payload)) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if not line.startswith("data:"):
+                    continue
+                event = _loads(line[5:])
+                if "extra_info" in event:
+                    # Final summary event repeats the full audio; skip it.
+                    continue
+                audio = event.get("data", {}).get("audio")
+                if audio:
+                    yield _decode_audio(audio)
+
+    def _get_client(self):
+        """One httpx.Client per provider instance: consecutive calls reuse the
+        TCP/TLS connection instead of re-handshaking."""
+        httpx = _get_httpx()
+
+        if self._client is None or self._client.is_closed:
+            # Locked: batch workers hit this concurrently on first use, and an
+            # unguarded check would construct and leak extra clients.
+            with self._client_lock:
+                if self._client is None or self._client.is_closed:
+                    self._client = httpx.Client(
+                        timeout=120.0,
+                        limits=httpx.Limits(max_connections=16, keepalive_expiry=60),
+                    )
+        return self._client
+
+    def close(self) -> None:
+        if self._client is not None and not self._client.is_closed:
+            self._client.close()
+
+    def _get_async_client(self):
+        """One shared AsyncClient per provider so batched calls reuse connections."""
+        httpx = _get_httpx()
+
+        if self._async_client is None or self._async_client.is_closed:
+            with self._client_lock:
+                if self._async_client is None or self._async_client.is_closed:
+                    self._async_client = httpx.AsyncClient(
+                        timeout=120.0,
+                        limits=httpx.Limits(max_connections=16, keepalive_expiry=60),
+                    )
+        return self._async_client
+
+    @classmethod
+    def is_valid_voice(cls, voice: str) -> bool:
+        return voice in MINIMAX_VOICE_SET
+
     def list_voices(self) -> list[str]:
-        return MINIMAX_VOICES
+        return list(MINIMAX_VOICES)
+
 
+def _extract_audio(raw: bytes) -> bytes | None:
+    """Pull the hex audio payload straight out of the raw response bytes.
 
-def _decode_audio(raw: str) -> bytes:
+    The field is a plain hex string (no escapes), so a substring scan plus a
+    one-shot unhexlify over a memoryview avoids materializing a multi-megabyte
+    Python str via the JSON decoder. Returns None if the scan doesn't apply.
+    """
+    marker = raw.find(b'"audio"')
+    if marker < 0:
+        return None
+    start = raw.find(b'"', marker + 7)
+    if start < 0:
+        return None
+    start += 1
+    end = raw.find(b'"', start)
+    if end <= start:
+        return None
+    try:
+        return binascii.unhexlify(memoryview(raw)[start:end])
+    except (binascii.Error, ValueError):
+        return None
+
+
+def _decode_audio(raw: bytes | str) -> bytes:
+    # bytes-like input goes straight through unhexlify's C loop; a str forces
+    # an internal ASCII conversion first, so prefer feeding bytes slices here.
     try:
         return binascii.unhexlify(raw)
     except (binascii.Error, ValueError):
         import base64
         return base64.b64decode(raw)
 
-
-def _get_mp3_duration(path: Path) -> float:
-    try:
-        from mutagen.mp3 import MP3
-        return MP3(str(path)).info.length
-    except Exception:
-        try:
-            from pydub import AudioSegment
-            return len(AudioSegment.from_mp3(str(path))) / 1000.0
-        except Exception:
-            return 0.0